@@ -0,0 +1,360 @@
+import argparse
+import cProfile
+import json
+import math
+import platform
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from plotting import get_pyplot
+
+
+class BenchCase(NamedTuple):
+    suite: str
+    name: str
+    size: str
+    setup: Callable[[], Tuple[Any, ...]]  # builds fresh arguments, not measured
+    run: Callable[..., Any]  # measured call, receives the setup result as arguments
+    items: Optional[int] = None  # objects built by the call, to report peak memory per item
+
+
+def linked_list_cases(quick: bool) -> Iterator[BenchCase]:
+    from task_1 import LinkedList
+
+    def build(values: List[int]) -> LinkedList:
+        linked_list = LinkedList()
+        for value in reversed(values):
+            linked_list.insert_at_beginning(value)
+        return linked_list
+
+    def insert_at_beginning(n: int) -> None:
+        linked_list = LinkedList()
+        for value in range(n):
+            linked_list.insert_at_beginning(value)
+
+    def insert_at_end(n: int) -> None:
+        linked_list = LinkedList()
+        for value in range(n):
+            linked_list.insert_at_end(value)
+
+    def merge_sort(linked_list: LinkedList) -> None:
+        linked_list.head = linked_list.merge_sort(linked_list.head)
+
+    def merge_sorted(first: LinkedList, second: LinkedList) -> None:
+        first.merge_sorted_lists(first, second)
+
+    sizes = [1000, 10_000] if quick else [1000, 10_000, 100_000]
+    # insert_at_end walks the whole list on every call, so it is quadratic
+    end_sizes = [500, 1000] if quick else [500, 1000, 2000, 4000]
+
+    for n in sizes:
+        yield BenchCase("linked_list", "insert_at_beginning", str(n), lambda n=n: (n,), insert_at_beginning)
+    for n in end_sizes:
+        yield BenchCase("linked_list", "insert_at_end", str(n), lambda n=n: (n,), insert_at_end)
+    for n in sizes:
+        yield BenchCase("linked_list", "merge_sort", str(n),
+                        lambda n=n: (build(random.sample(range(n * 10), n)),), merge_sort)
+    for n in sizes:
+        yield BenchCase("linked_list", "merge_sorted_lists", str(n),
+                        lambda n=n: (build(list(range(0, 2 * n, 2))), build(list(range(1, 2 * n, 2)))),
+                        merge_sorted)
+
+
+def dijkstra_cases(quick: bool) -> Iterator[BenchCase]:
+    import networkx as nx
+    from task_3 import dijkstra_algorithm
+
+    def random_graph(n: int) -> Tuple[Any, ...]:
+        graph = nx.gnm_random_graph(n, 4 * n, seed=n)
+        for u, v in graph.edges:
+            graph[u][v]["weight"] = random.randint(1, 100)
+        return graph, 0
+
+    sizes = [100, 1000] if quick else [100, 1000, 10_000, 50_000]
+    for n in sizes:
+        yield BenchCase("dijkstra", "dijkstra_algorithm", f"{n} nodes", lambda n=n: random_graph(n),
+                        dijkstra_algorithm)
+
+
+def fractal_cases(quick: bool) -> Iterator[BenchCase]:
+    from task_2 import draw_pythagoras_tree
+
+    # benchmarks never open windows, even when a display is available
+    plt = get_pyplot(force_agg=True)
+
+    def axes(depth: int) -> Tuple[Any, ...]:
+        plt.close("all")
+        _, ax = plt.subplots()
+        return 0, 0, math.pi / 2, 100, depth, ax
+
+    depths = [4, 8] if quick else [4, 6, 8, 10, 12]
+    for depth in depths:
+        yield BenchCase("fractal", "draw_pythagoras_tree", f"depth {depth}", lambda d=depth: axes(d),
+                        draw_pythagoras_tree)
+
+
+def heap_tree_cases(quick: bool) -> Iterator[BenchCase]:
+    from binary_tree import count_nodes, level_order_to_tree, list_to_heap_tree, sorted_to_bst
+    from task_5 import bfs_visualize, dfs_visualize
+
+    def heap_list(n: int) -> List[int]:
+        return [random.randint(0, n) for _ in range(n)]
+
+    def tree(n: int) -> Tuple[Any, ...]:
+        root = list_to_heap_tree(heap_list(n))
+        return root, count_nodes(root)
+
+    sizes = [1000, 10_000] if quick else [1000, 10_000, 100_000]
+    for n in sizes:
+        yield BenchCase("heap_tree", "list_to_heap_tree", str(n), lambda n=n: (heap_list(n),), list_to_heap_tree)
+    for n in sizes:
+        yield BenchCase("heap_tree", "sorted_to_bst", str(n), lambda n=n: (sorted(heap_list(n)),), sorted_to_bst)
+    for n in sizes:
+        yield BenchCase("heap_tree", "level_order_to_tree", str(n), lambda n=n: (heap_list(n),),
+                        level_order_to_tree)
+    for n in sizes:
+        yield BenchCase("heap_tree", "dfs_visualize", str(n), lambda n=n: tree(n), dfs_visualize)
+    for n in sizes:
+        yield BenchCase("heap_tree", "bfs_visualize", str(n), lambda n=n: tree(n), bfs_visualize)
+
+
+class _UuidNode:
+    """
+    The node layout task_4 and task_5 used before binary_tree: a per-instance
+    __dict__, a UUID string id and a color string. Kept only as a memory baseline
+    """
+
+    def __init__(self, key: int, color: str = "skyblue"):
+        self.left = None
+        self.right = None
+        self.val = key
+        self.color = color
+        self.id = str(uuid.uuid4())
+
+
+def node_memory_cases(quick: bool) -> Iterator[BenchCase]:
+    from binary_tree import Node
+
+    def build(node_class: type, n: int) -> List[Any]:
+        nodes = [node_class(i) for i in range(n)]
+        for i, node in enumerate(nodes):
+            if 2 * i + 1 < n:
+                node.left = nodes[2 * i + 1]
+            if 2 * i + 2 < n:
+                node.right = nodes[2 * i + 2]
+        return nodes
+
+    # 10^6 nodes is the size the per-node comparison is quoted at, so it stays in quick runs
+    sizes = [10_000, 1_000_000] if quick else [10_000, 100_000, 1_000_000]
+    for n in sizes:
+        yield BenchCase("node_memory", "uuid_node", str(n), lambda n=n: (_UuidNode, n), build, n)
+        yield BenchCase("node_memory", "slots_node", str(n), lambda n=n: (Node, n), build, n)
+
+
+def knapsack_cases(quick: bool) -> Iterator[BenchCase]:
+    from task_6 import dynamic_programming, greedy_algorithm
+
+    def items(count: int, budget: int) -> Tuple[Any, ...]:
+        generated = {
+            f"item_{i}": {"cost": random.randint(1, max(1, budget // 4)), "calories": random.randint(50, 500)}
+            for i in range(count)
+        }
+        return generated, budget
+
+    item_counts = [10, 50] if quick else [10, 50, 200]
+    budgets = [100, 1000] if quick else [100, 1000, 10_000]
+    for count in item_counts:
+        for budget in budgets:
+            size = f"{count} items x {budget}"
+            yield BenchCase("knapsack", "greedy_algorithm", size,
+                            lambda c=count, b=budget: items(c, b), greedy_algorithm)
+            yield BenchCase("knapsack", "dynamic_programming", size,
+                            lambda c=count, b=budget: items(c, b), dynamic_programming)
+
+
+def dice_cases(quick: bool) -> Iterator[BenchCase]:
+    from task_7 import simulate_dice_rolls
+
+    sizes = [1000, 100_000] if quick else [1000, 10_000, 100_000, 1_000_000, 10_000_000]
+    for n in sizes:
+        yield BenchCase("dice", "simulate_dice_rolls", str(n), lambda n=n: (n,), simulate_dice_rolls)
+
+
+SUITES: Dict[str, Callable[[bool], Iterator[BenchCase]]] = {
+    "linked_list": linked_list_cases,
+    "dijkstra": dijkstra_cases,
+    "fractal": fractal_cases,
+    "heap_tree": heap_tree_cases,
+    "node_memory": node_memory_cases,
+    "knapsack": knapsack_cases,
+    "dice": dice_cases,
+}
+
+
+def hot_spots(profiler: cProfile.Profile, limit: int) -> List[Dict[str, Any]]:
+    """
+    Returns the 'limit' functions with the highest cumulative time
+    """
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            "function": f"{filename}:{line}({func})",
+            "calls": calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        })
+    rows.sort(key=lambda row: row["cumtime"], reverse=True)
+    return rows[:limit]
+
+
+def case_seed(seed: int, case: BenchCase) -> int:
+    """
+    Derives a stable per-case seed, so a case gets the same input no matter
+    which other suites run before it (str hash() is randomized per process)
+    """
+    return zlib.crc32(f"{seed}:{case.suite}:{case.name}:{case.size}".encode())
+
+
+def measure(case: BenchCase, repeat: int, profile: bool, seed: int = 42,
+            profile_limit: int = 10) -> Dict[str, Any]:
+    """
+    Runs a single benchmark case
+    Wall time is the best of 'repeat' runs; peak memory and the optional profile
+    come from separate runs so tracing overhead does not distort the timing.
+    Every run reseeds 'random' with the same per-case seed, so all of them see the same input
+    """
+    def setup() -> Tuple[Any, ...]:
+        random.seed(case_seed(seed, case))
+        return case.setup()
+
+    timings = []
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        case.run(*args)
+        timings.append(time.perf_counter() - start)
+
+    args = setup()
+    tracemalloc.start()
+    case.run(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result: Dict[str, Any] = {
+        "suite": case.suite,
+        "name": case.name,
+        "size": case.size,
+        "wall_time": min(timings),
+        "mean_time": sum(timings) / len(timings),
+        "peak_memory": peak,
+    }
+    if case.items:
+        result["items"] = case.items
+        result["peak_memory_per_item"] = peak / case.items
+
+    if profile:
+        args = setup()
+        profiler = cProfile.Profile()
+        profiler.runcall(case.run, *args)
+        result["hot_spots"] = hot_spots(profiler, profile_limit)
+
+    return result
+
+
+def run_benchmarks(suites: List[str], repeat: int = 3, quick: bool = False,
+                   profile: bool = False, seed: int = 42) -> List[Dict[str, Any]]:
+    results = []
+    for suite in suites:
+        for case in SUITES[suite](quick):
+            result = measure(case, repeat, profile, seed)
+            line = (f"{result['suite']:<12} {result['name']:<22} {result['size']:<22} "
+                    f"{result['wall_time'] * 1000:>10.2f} ms {result['peak_memory'] / 1024:>12.1f} KiB")
+            if "peak_memory_per_item" in result:
+                line += f" {result['peak_memory_per_item']:>8.1f} B/item"
+            print(line)
+            results.append(result)
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float,
+            memory_threshold: float) -> List[Tuple[Dict[str, Any], str, float]]:
+    """
+    Finds cases whose wall time grew by more than 'threshold' or whose peak memory
+    grew by more than 'memory_threshold' (0.2 means 20%) relative to the baseline run
+    Returns (result, metric, growth ratio) triples
+    """
+    limits = {"wall_time": threshold, "peak_memory": memory_threshold}
+    previous = {(row["suite"], row["name"], row["size"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["suite"], row["name"], row["size"]))
+        if old is None:
+            continue
+        for metric, limit in limits.items():
+            if old[metric] == 0:
+                continue
+            ratio = row[metric] / old[metric]
+            if ratio > 1 + limit:
+                regressions.append((row, metric, ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless benchmarks for task_1..task_7")
+    parser.add_argument("suites", nargs="*", metavar="SUITE",
+                        help=f"suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, best is reported")
+    parser.add_argument("--quick", action="store_true", help="use smaller sweeps")
+    parser.add_argument("--profile", action="store_true", help="include cProfile hot spots")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown against the baseline (default: 0.2)")
+    parser.add_argument("--memory-threshold", type=float, default=0.2,
+                        help="allowed peak memory growth against the baseline (default: 0.2)")
+    args = parser.parse_args(argv)
+    unknown = [suite for suite in args.suites if suite not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    results = run_benchmarks(args.suites or list(SUITES), args.repeat, args.quick, args.profile, args.seed)
+
+    if args.profile:
+        for result in results:
+            print(f"----- {result['suite']} {result['name']} {result['size']} -----")
+            for spot in result["hot_spots"]:
+                print(f"{spot['cumtime'] * 1000:>10.2f} ms {spot['calls']:>10} {spot['function']}")
+
+    if args.json:
+        report = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        for row, metric, ratio in regressions:
+            change = "slower" if metric == "wall_time" else "more peak memory"
+            print(f"REGRESSION {row['suite']} {row['name']} {row['size']}: {ratio:.2f}x {change}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
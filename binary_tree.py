@@ -0,0 +1,152 @@
+import collections
+import itertools
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from plotting import get_pyplot
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+DEFAULT_COLOR = "skyblue"
+
+# process-wide counter, so ids stay unique across trees
+_node_ids = itertools.count()
+
+
+class Node:
+    # no per-instance __dict__; colors are kept in a separate {id: color} dict
+    __slots__ = ("left", "right", "val", "id")
+
+    def __init__(self, key: int):
+        self.left: Optional[Node] = None
+        self.right: Optional[Node] = None
+        self.val: int = key
+        self.id: int = next(_node_ids)
+
+
+def list_to_heap_tree(heap_list: List[int]) -> Optional[Node]:
+    """
+    Converts a list (representing a binary heap) into a tree of Node objects
+    Logic:
+    - Index i: Parent
+    - Index 2*i + 1: Left Child
+    - Index 2*i + 2: Right Child
+    """
+    if not heap_list:
+        return None
+
+    nodes = [Node(val) for val in heap_list]
+    for i, current_node in enumerate(nodes):
+        left_index = 2 * i + 1
+        right_index = 2 * i + 2
+
+        # left child
+        if left_index < len(nodes):
+            current_node.left = nodes[left_index]
+
+        # right child
+        if right_index < len(nodes):
+            current_node.right = nodes[right_index]
+
+    # return the root
+    return nodes[0]
+
+
+def sorted_to_bst(sorted_values: Sequence[int]) -> Optional[Node]:
+    """
+    Builds a height-balanced binary search tree from a sorted sequence
+    by always taking the middle element as the subtree root
+    """
+    def build(low: int, high: int) -> Optional[Node]:
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = Node(sorted_values[mid])
+        node.left = build(low, mid - 1)
+        node.right = build(mid + 1, high)
+        return node
+
+    return build(0, len(sorted_values) - 1)
+
+
+def level_order_to_tree(values: Sequence[Optional[int]]) -> Optional[Node]:
+    """
+    Builds a tree from its level-order listing where None marks a missing child,
+    e.g. [1, 2, 3, None, 4] (children of missing nodes are not listed)
+    """
+    if not values or values[0] is None:
+        return None
+
+    root = Node(values[0])
+    queue: collections.deque[Node] = collections.deque([root])
+    index = 1
+    while queue and index < len(values):
+        node = queue.popleft()
+
+        if index < len(values) and values[index] is not None:
+            node.left = Node(values[index])
+            queue.append(node.left)
+        index += 1
+
+        if index < len(values) and values[index] is not None:
+            node.right = Node(values[index])
+            queue.append(node.right)
+        index += 1
+
+    return root
+
+
+def count_nodes(root: Optional[Node]) -> int:
+    count = 0
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        count += 1
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return count
+
+
+def add_edges(graph: 'nx.DiGraph', node: Optional[Node], pos: Dict[int, Tuple[float, float]],
+              x: float = 0, y: float = 0, layer: int = 1) -> 'nx.DiGraph':
+    """
+    Recursively adds nodes and edges to the graph
+    Returns the modified graph
+    """
+    if node is not None:
+        graph.add_node(node.id, label=node.val)
+
+        if node.left:
+            graph.add_edge(node.id, node.left.id)
+            l = x - 1 / 2 ** layer
+            pos[node.left.id] = (l, y - 1)
+            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
+
+        if node.right:
+            graph.add_edge(node.id, node.right.id)
+            r = x + 1 / 2 ** layer
+            pos[node.right.id] = (r, y - 1)
+            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+
+    return graph
+
+
+def draw_tree(tree_root: Optional[Node], colors: Optional[Dict[int, str]] = None) -> None:
+    import networkx as nx
+    plt = get_pyplot()
+
+    tree = nx.DiGraph()
+    pos: Dict[int, Tuple[float, float]] = {tree_root.id: (0, 0)}
+    tree = add_edges(tree, tree_root, pos)
+
+    # Apply colors, if a node ID is not in the colors dict, default to skyblue
+    colors = colors or {}
+    node_colors = [colors.get(node_id, DEFAULT_COLOR) for node_id in tree.nodes()]
+    labels = {node_id: data["label"] for node_id, data in tree.nodes(data=True)}
+
+    plt.figure(figsize=(8, 5))
+    nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=node_colors)
+    plt.title("Tree Visualization")
+    plt.show()
@@ -0,0 +1,27 @@
+import os
+import sys
+from types import ModuleType
+
+
+def is_headless() -> bool:
+    """
+    Checks whether there is no display to open plot windows on.
+    An explicitly configured MPLBACKEND is always respected
+    """
+    if os.environ.get("MPLBACKEND"):
+        return False
+    if sys.platform.startswith("linux"):
+        return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return False
+
+
+def get_pyplot(force_agg: bool = False) -> ModuleType:
+    """
+    Imports matplotlib.pyplot on first use, forcing the non-interactive
+    Agg backend when running headless or when 'force_agg' is set
+    """
+    import matplotlib
+    if force_agg or is_headless():
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
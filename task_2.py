@@ -1,10 +1,14 @@
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-import numpy as np
+import math
+from typing import TYPE_CHECKING
+
+from plotting import get_pyplot
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 def draw_pythagoras_tree(x: float, y: float, angle: float,
-                         length: float, depth: int, ax: Axes) -> None:
+                         length: float, depth: int, ax: 'Axes') -> None:
     """
     Recursively draws a binary fractal tree (Pythagoras Tree) using matplotlib
     Args:
@@ -19,8 +23,8 @@ def draw_pythagoras_tree(x: float, y: float, angle: float,
         return
 
     # end coordinates of the branch
-    x_end = x + length * np.cos(angle)
-    y_end = y + length * np.sin(angle)
+    x_end = x + length * math.cos(angle)
+    y_end = y + length * math.sin(angle)
 
     # color and line width based on depth
     color = "black" if depth > 4 else "green"
@@ -29,7 +33,7 @@ def draw_pythagoras_tree(x: float, y: float, angle: float,
     ax.plot([x, x_end], [y, y_end], color=color, lw=line_width)
 
     new_length = length * 0.7  # reduce branch length
-    delta_angle = np.pi / 4  # 45 degrees branch split
+    delta_angle = math.pi / 4  # 45 degrees branch split
 
     # left branch
     draw_pythagoras_tree(x_end, y_end, angle + delta_angle, new_length, depth - 1, ax)
@@ -51,9 +55,10 @@ if __name__ == "__main__":
         print("Invalid number. Using default value: 8.")
         recursion_depth = 8
 
+    plt = get_pyplot()
     fig, ax = plt.subplots(figsize=(10, 8))
     ax.axis("off")
     ax.set_title(f"Pythagoras Tree (Depth: {recursion_depth})")
 
-    draw_pythagoras_tree(0, 0, np.pi / 2, 100, recursion_depth, ax)
+    draw_pythagoras_tree(0, 0, math.pi / 2, 100, recursion_depth, ax)
     plt.show()
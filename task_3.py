@@ -1,10 +1,13 @@
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
+from plotting import get_pyplot
 
-def dijkstra_algorithm(graph: nx.Graph, start: str) -> Dict[str, float]:
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def dijkstra_algorithm(graph: 'nx.Graph', start: str) -> Dict[str, float]:
     """
     Implements Dijkstra's algorithm to find the shortest paths from
     starting node to all other nodes in a weighted graph using a binary heap.
@@ -30,7 +33,27 @@ def dijkstra_algorithm(graph: nx.Graph, start: str) -> Dict[str, float]:
     return shortest_paths
 
 
+def draw_graph(graph: 'nx.Graph', start: str) -> None:
+    import networkx as nx
+    plt = get_pyplot()
+
+    pos = nx.spring_layout(graph, seed=42)
+    plt.figure(figsize=(8, 5))
+    nx.draw_networkx_nodes(graph, pos, node_size=700, node_color="skyblue")
+    nx.draw_networkx_edges(graph, pos, width=2, alpha=0.6, edge_color="gray")
+    nx.draw_networkx_labels(graph, pos, font_size=16, font_family="sans-serif")
+
+    edge_labels = nx.get_edge_attributes(graph, "weight")
+    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=12)
+
+    plt.title(f"Weighted Graph (Start: {start})")
+    plt.axis("off")
+    plt.show()
+
+
 if __name__ == "__main__":
+    import networkx as nx
+
     G = nx.Graph()
     G.add_edge("A", "B", weight=4)
     G.add_edge("A", "C", weight=2)
@@ -49,15 +72,4 @@ if __name__ == "__main__":
     for node, distance in shortest_paths.items():
         print(f"To {node}: {distance}")
 
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(8, 5))
-    nx.draw_networkx_nodes(G, pos, node_size=700, node_color="skyblue")
-    nx.draw_networkx_edges(G, pos, width=2, alpha=0.6, edge_color="gray")
-    nx.draw_networkx_labels(G, pos, font_size=16, font_family="sans-serif")
-
-    edge_labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=12)
-
-    plt.title(f"Weighted Graph (Start: {start_node})")
-    plt.axis("off")
-    plt.show()
+    draw_graph(G, start_node)
@@ -1,88 +1,11 @@
-import uuid
-import networkx as nx
-import matplotlib.pyplot as plt
 import heapq
 import collections
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict
 
+from binary_tree import Node, count_nodes, draw_tree, list_to_heap_tree
 
-class Node:
-    def __init__(self, key: int, color: str = "skyblue"):
-        self.left: Optional[Node] = None
-        self.right: Optional[Node] = None
-        self.val: int = key
-        self.color: str = color
-        self.id: str = str(uuid.uuid4())
 
-
-def add_edges(graph: nx.DiGraph, node: Optional[Node], pos: Dict[str, Tuple[float, float]],
-              x: float = 0, y: float = 0, layer: int = 1) -> nx.DiGraph:
-    """
-    Recursively adds nodes and edges to the graph
-    Returns the modified graph
-    """
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)
-
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
-
-    return graph
-
-
-def draw_tree(tree_root: Optional[Node], colors: Dict[str, str]) -> None:
-    tree = nx.DiGraph()
-    pos: Dict[str, Tuple[float, float]] = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
-
-    # Apply colors, if a node ID is not in the colors dict, default to skyblue
-    node_colors = [colors.get(node_id, "skyblue") for node_id in tree.nodes()]
-    labels = {node_id: data["label"] for node_id, data in tree.nodes(data=True)}
-
-    plt.figure(figsize=(8, 5))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=node_colors)
-    plt.title("Tree Visualization")
-    plt.show()
-
-
-def list_to_heap_tree(heap_list: List[int]) -> Optional[Node]:
-    """
-    Converts a list (representing a binary heap) into a tree of Node objects
-    Logic:
-    - Index i: Parent
-    - Index 2*i + 1: Left Child
-    - Index 2*i + 2: Right Child
-    """
-    if not heap_list:
-        return None
-
-    nodes = [Node(val) for val in heap_list]
-    for i, current_node in enumerate(nodes):
-        left_index = 2 * i + 1
-        right_index = 2 * i + 2
-
-        # left child
-        if left_index < len(nodes):
-            current_node.left = nodes[left_index]
-
-        # ight child
-        if right_index < len(nodes):
-            current_node.right = nodes[right_index]
-
-    # return the root
-    return nodes[0]
-
-
-def dfs_visualize(root: Optional[Node], total_steps: int) -> Dict[str, str]:
+def dfs_visualize(root: Optional[Node], total_steps: int) -> Dict[int, str]:
     """
     Depth-First Search (DFS) using stack (LIFO) and assigns colors based on visit order.
     Returns a dictionary mapping Node IDs to colors
@@ -90,7 +13,7 @@ def dfs_visualize(root: Optional[Node], total_steps: int) -> Dict[str, str]:
     if root is None:
         return {}
 
-    visited_colors: Dict[str, str] = {}
+    visited_colors: Dict[int, str] = {}
     stack: List[Node] = [root]
     step = 0
     while stack:
@@ -107,7 +30,7 @@ def dfs_visualize(root: Optional[Node], total_steps: int) -> Dict[str, str]:
     return visited_colors
 
 
-def bfs_visualize(root: Optional[Node], total_steps: int) -> Dict[str, str]:
+def bfs_visualize(root: Optional[Node], total_steps: int) -> Dict[int, str]:
     """
     Breadth-First Search (BFS) using queue (FIFO) and assigns colors based on visit order.
     Returns a dictionary mapping Node IDs to colors
@@ -115,7 +38,7 @@ def bfs_visualize(root: Optional[Node], total_steps: int) -> Dict[str, str]:
     if root is None:
         return {}
 
-    visited_colors: Dict[str, str] = {}
+    visited_colors: Dict[int, str] = {}
     queue: collections.deque[Node] = collections.deque([root])
     step = 0
     while queue:
@@ -156,12 +79,6 @@ def generate_color(step: int, total_steps: int) -> str:
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
-def count_nodes(node: Optional[Node]) -> int:
-    if node is None:
-        return 0
-    return 1 + count_nodes(node.left) + count_nodes(node.right)
-
-
 if __name__ == '__main__':
     heap_list = [1, 3, 5, 7, 9, 2, 4, 34, 2, 1, 2]
     heapq.heapify(heap_list)
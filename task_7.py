@@ -1,48 +1,366 @@
+import math
 import random
-from typing import Dict
+from functools import lru_cache
+from statistics import NormalDist
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 
-def simulate_dice_rolls(num_rolls: int) -> Dict[int, float]:
+# above this number of dice the exact distribution is computed via FFT
+# instead of repeated direct convolution
+FFT_DICE_THRESHOLD = 64
+
+# upper bound on single die draws held in memory at once while simulating
+CHUNK_DRAWS = 1_000_000
+
+
+def _single_die_pmf(faces: int, weights: Optional[Tuple[float, ...]]) -> np.ndarray:
+    """
+    Returns the probability mass function of a single die with 'faces' sides.
+    Weights (if given) are normalized to sum to 1
+    """
+    if faces < 1:
+        raise ValueError("A die must have at least one face")
+    if weights is None:
+        return np.full(faces, 1 / faces)
+
+    pmf = np.asarray(weights, dtype=float)
+    if len(pmf) != faces:
+        raise ValueError(f"Expected {faces} weights, got {len(pmf)}")
+    if not np.all(np.isfinite(pmf)):
+        raise ValueError("Weights must be finite numbers")
+    if np.any(pmf < 0) or pmf.sum() <= 0:
+        raise ValueError("Weights must be non-negative and not all zero")
+    return pmf / pmf.sum()
+
+
+def _weights_key(weights: Optional[Sequence[float]]) -> Optional[Tuple[float, ...]]:
+    return tuple(float(w) for w in weights) if weights is not None else None
+
+
+@lru_cache(maxsize=None)
+def _exact_pmf(num_dice: int, faces: int, weights: Optional[Tuple[float, ...]]) -> Tuple[float, ...]:
+    """
+    Cached exact distribution of the sum of 'num_dice' identical dice.
+    Element k is the probability of the sum num_dice + k
+    """
+    if num_dice < 1:
+        raise ValueError("At least one die is required")
+    die = _single_die_pmf(faces, weights)
+
+    if num_dice <= FFT_DICE_THRESHOLD:
+        # repeated convolution of the single die distribution
+        pmf = die
+        for _ in range(num_dice - 1):
+            pmf = np.convolve(pmf, die)
+    else:
+        # convolution theorem: the n-fold convolution is the n-th power in frequency domain
+        size = num_dice * (faces - 1) + 1
+        spectrum = np.fft.rfft(die, n=size)
+        pmf = np.fft.irfft(spectrum ** num_dice, n=size)
+        # remove floating point noise around zero
+        pmf = np.clip(pmf, 0, None)
+        pmf /= pmf.sum()
+
+    return tuple(float(p) for p in pmf)
+
+
+@lru_cache(maxsize=None)
+def _outcome_counts(num_dice: int, faces: int) -> Tuple[int, ...]:
+    """
+    Exact number of fair-dice outcomes for each sum, using integer convolution
+    so the counts stay exact however large faces ** num_dice gets.
+    Element k is the count for the sum num_dice + k
     """
-    Simulates rolling two dice 'num_rolls' times
-    Returns: 
-        A dictionary where keys are the sums (2-12)
+    counts = [1] * faces
+    for _ in range(num_dice - 1):
+        convolved = [0] * (len(counts) + faces - 1)
+        for i, ways in enumerate(counts):
+            for face in range(faces):
+                convolved[i + face] += ways
+        counts = convolved
+    return tuple(counts)
+
+
+def exact_distribution(num_dice: int = 2, faces: int = 6,
+                       weights: Optional[Sequence[float]] = None) -> Dict[int, float]:
+    """
+    Computes the exact probability of each sum when rolling 'num_dice' dice
+    with 'faces' sides each
+    Args:
+        num_dice (int): Number of dice rolled at once
+        faces (int): Number of faces on each die (numbered 1..faces)
+        weights (Sequence[float]): Optional relative weight of each face
+    Returns:
+        A dictionary where keys are the sums (num_dice..num_dice*faces)
+        and values are the probability of that sum
+    """
+    pmf = _exact_pmf(num_dice, faces, _weights_key(weights))
+    return {num_dice + k: p for k, p in enumerate(pmf)}
+
+
+def _roll_counts(rng: np.random.Generator, num_rolls: int, num_dice: int,
+                 die: np.ndarray) -> np.ndarray:
+    """
+    Rolls 'num_dice' dice 'num_rolls' times and counts how often each sum appeared.
+    Element k of the result is the count of the sum num_dice + k
+    """
+    if num_rolls < 1:
+        raise ValueError("At least one roll is required")
+    if num_dice < 1:
+        raise ValueError("At least one die is required")
+    faces = len(die)
+    size = num_dice * (faces - 1) + 1
+    counts = np.zeros(size, dtype=np.int64)
+
+    # draw in chunks so memory stays bounded regardless of rolls x dice
+    chunk_rolls = max(1, CHUNK_DRAWS // num_dice)
+    remaining = num_rolls
+    while remaining > 0:
+        batch = min(chunk_rolls, remaining)
+        rolls = rng.choice(faces, size=(batch, num_dice), p=die)
+        # faces are drawn as 0..faces-1, so the smallest sum maps to index 0
+        counts += np.bincount(rolls.sum(axis=1), minlength=size)
+        remaining -= batch
+    return counts
+
+
+def _make_rng(seed: Optional[int]) -> np.random.Generator:
+    # without an explicit seed follow the random module, so random.seed() still applies
+    return np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+
+
+def simulate_dice_rolls(num_rolls: int, num_dice: int = 2, faces: int = 6,
+                        weights: Optional[Sequence[float]] = None,
+                        seed: Optional[int] = None) -> Dict[int, float]:
+    """
+    Simulates rolling 'num_dice' dice 'num_rolls' times
+    Returns:
+        A dictionary where keys are the sums (num_dice..num_dice*faces)
         and values are the probability of that sum appearing
     """
-    # counters for sums from 2 to 12
-    counts = {sum_val: 0 for sum_val in range(2, 13)}
+    die = _single_die_pmf(faces, _weights_key(weights))
 
-    for _ in range(num_rolls):
-        d1 = random.randint(1, 6)
-        d2 = random.randint(1, 6)
-        roll_sum = d1 + d2
-        counts[roll_sum] += 1
+    rng = _make_rng(seed)
+    counts = _roll_counts(rng, num_rolls, num_dice, die)
 
-    probabilities = {k: v / num_rolls for k, v in counts.items()}
+    probabilities = {num_dice + k: int(v) / num_rolls for k, v in enumerate(counts)}
 
     return probabilities
 
 
-def print_comparison_table(input_probs: Dict[int, float]):
-    # theoretical probabilities for sums 2 through 12
-    theoretical_probs = {
-        2: 1/36, 3: 2/36, 4: 3/36, 5: 4/36, 6: 5/36,
-        7: 6/36, 8: 5/36, 9: 4/36, 10: 3/36, 11: 2/36, 12: 1/36
-    }
+def _chi_square_sf(statistic: float, dof: int) -> float:
+    """
+    Survival function of the chi-square distribution (the p-value of 'statistic'),
+    i.e. the regularized upper incomplete gamma function Q(dof / 2, statistic / 2)
+    """
+    if dof < 1 or statistic <= 0:
+        return 1.0
+    a = dof / 2
+    x = statistic / 2
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        # series for the lower function P(a, x), Q = 1 - P
+        term = total = 1 / a
+        k = a
+        while abs(term) > abs(total) * 1e-15:
+            k += 1
+            term *= x / k
+            total += term
+        return max(0.0, 1 - total * math.exp(log_prefix))
+
+    # continued fraction for Q(a, x) evaluated with the modified Lentz method
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, h * math.exp(log_prefix))
+
+
+class ConvergenceSnapshot(NamedTuple):
+    rolls: int
+    max_deviation: float  # largest |Monte Carlo - theoretical| over all sums
+    chi_square: float  # Pearson statistic against the theoretical distribution
+    dof: int  # degrees of freedom of the chi-square test
+    p_value: float  # chance of a chi-square at least this large if the dice match the theory
+    margin: float  # confidence interval half-width for the least certain sum
+
+
+class IncrementalDiceSimulator:
+    """
+    Monte Carlo dice simulator that keeps running counts between batches,
+    so increasing the number of rolls never discards earlier work
+    """
+
+    def __init__(self, num_dice: int = 2, faces: int = 6,
+                 weights: Optional[Sequence[float]] = None, confidence: float = 0.95,
+                 seed: Optional[int] = None):
+        self.num_dice = num_dice
+        self.faces = faces
+        self.weights = _weights_key(weights)
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1 (exclusive)")
+        self.confidence = confidence
+        self.total_rolls = 0
+        self.history: List[ConvergenceSnapshot] = []
+
+        self._die = _single_die_pmf(faces, self.weights)
+        self._theoretical = np.array(_exact_pmf(num_dice, faces, self.weights))
+        self._counts = np.zeros(len(self._theoretical), dtype=np.int64)
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self._rng = _make_rng(seed)
+
+    def roll(self, num_rolls: int) -> ConvergenceSnapshot:
+        """
+        Adds 'num_rolls' rolls to the running counts
+        Returns the convergence snapshot taken after the batch
+        """
+        self._counts += _roll_counts(self._rng, num_rolls, self.num_dice, self._die)
+        self.total_rolls += num_rolls
+
+        snapshot = self._snapshot()
+        self.history.append(snapshot)
+        return snapshot
+
+    def run(self, max_rolls: int, batch_size: int = 10_000, tolerance: Optional[float] = None,
+            min_p_value: Optional[float] = None) -> List[ConvergenceSnapshot]:
+        """
+        Rolls in batches until 'max_rolls' is reached or an early stopping rule holds.
+        With 'tolerance' the run stops once both the observed maximum deviation and
+        the confidence interval half-width are at most 'tolerance'. The half-width
+        depends only on the number of rolls, so 'confidence' acts as a minimum
+        sample size of z^2 * max p(1 - p) / tolerance^2 rolls.
+        'min_p_value' is only an extra guard on the tolerance rule and never stops
+        the run by itself: the chi-square goodness-of-fit p-value must also be at
+        least 'min_p_value', so the run does not stop while the counts are still
+        significantly inconsistent with the theoretical distribution
+        Returns the snapshots taken during this run
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if min_p_value is not None and tolerance is None:
+            # a high p-value alone only means "no evidence of mismatch", not convergence
+            raise ValueError("min_p_value requires tolerance")
+        start = len(self.history)
+        while self.total_rolls < max_rolls:
+            snapshot = self.roll(min(batch_size, max_rolls - self.total_rolls))
+            if tolerance is None:
+                continue
+            within_tolerance = max(snapshot.max_deviation, snapshot.margin) <= tolerance
+            consistent = min_p_value is None or snapshot.p_value >= min_p_value
+            if within_tolerance and consistent:
+                break
+        return self.history[start:]
+
+    def probabilities(self) -> Dict[int, float]:
+        if self.total_rolls == 0:
+            return {}
+        return {self.num_dice + k: int(v) / self.total_rolls for k, v in enumerate(self._counts)}
+
+    def deviation_series(self) -> List[Tuple[int, float]]:
+        """
+        Returns (rolls, max deviation) pairs for every snapshot taken so far
+        """
+        return [(snap.rolls, snap.max_deviation) for snap in self.history]
+
+    def _snapshot(self) -> ConvergenceSnapshot:
+        n = self.total_rolls
+        observed = self._counts / n
+        max_deviation = float(np.max(np.abs(observed - self._theoretical)))
+
+        # sums that cannot occur (zero weight faces) do not contribute
+        possible = self._theoretical > 0
+        expected = self._theoretical[possible] * n
+        chi_square = float(np.sum((self._counts[possible] - expected) ** 2 / expected))
+        dof = int(np.count_nonzero(possible)) - 1
+        p_value = _chi_square_sf(chi_square, dof)
+
+        # normal approximation of the binomial standard error, largest at p closest to 0.5
+        p = self._theoretical
+        margin = float(self._z * np.sqrt(np.max(p * (1 - p)) / n))
+
+        return ConvergenceSnapshot(n, max_deviation, chi_square, dof, p_value, margin)
+
+
+def print_comparison_table(input_probs: Dict[int, float], num_dice: int = 2, faces: int = 6,
+                           weights: Optional[Sequence[float]] = None) -> None:
+    theoretical_probs = exact_distribution(num_dice, faces, weights)
 
     print(f"{'Sum':<5} | {'Monte Carlo':<12} | {'Theoretical':<12} | {'Difference':<12}")
     print("-" * 50)
-    for sum_val in range(2, 13):
+    for sum_val, th_prob in theoretical_probs.items():
         mc_prob = input_probs.get(sum_val, 0)
-        th_prob = theoretical_probs[sum_val]
         diff = abs(mc_prob - th_prob)
         print(f"{sum_val:<5} | {mc_prob:<12.4f} | {th_prob:<12.4f} | {diff:<12.4f}")
     print("-" * 50)
 
 
+def markdown_comparison_table(input_probs: Dict[int, float], num_dice: int = 2, faces: int = 6,
+                              weights: Optional[Sequence[float]] = None) -> str:
+    """
+    Builds the comparison table in the Markdown format used by the README
+    """
+    theoretical_probs = exact_distribution(num_dice, faces, weights)
+    outcomes = faces ** num_dice
+    ways = _outcome_counts(num_dice, faces) if weights is None else None
+
+    lines = [
+        "| Sum | Analytical Probability | Monte Carlo Result | Deviation |",
+        "|:---:|:----------------------:|:-------------------------:|:---------:|",
+    ]
+    for k, (sum_val, th_prob) in enumerate(theoretical_probs.items()):
+        mc_prob = input_probs.get(sum_val, 0)
+        analytical = f"{th_prob:.2%}"
+        if ways is not None:
+            analytical += f" ({ways[k]}/{outcomes})"
+        deviation = f"{abs(mc_prob - th_prob):.3%}"
+        lines.append(f"| {sum_val:^3} | {analytical:<22} | {mc_prob:<25.2%} | {deviation:<9} |")
+    return "\n".join(lines)
+
+
+# fixed seed of the demo run, so the README table can be reproduced exactly
+README_SEED = 42
+
+
 if __name__ == "__main__":
+    # the same simulator is extended at each checkpoint instead of rerunning from scratch
+    simulator = IncrementalDiceSimulator(seed=README_SEED)
     simulation_counts = [100, 1000, 10_000, 1_000_000]
     for accuracy in simulation_counts:
         print(f"----- Running simulation for {accuracy} rolls -----")
-        probs = simulate_dice_rolls(accuracy)
-        print_comparison_table(probs)
+        snap = simulator.roll(accuracy - simulator.total_rolls)
+        print_comparison_table(simulator.probabilities())
+        print(f"Max deviation: {snap.max_deviation:.5f}, "
+              f"chi-square: {snap.chi_square:.2f} (dof {snap.dof}, p-value {snap.p_value:.3f})")
+
+    print("----- Deviation by number of rolls -----")
+    for rolls, deviation in simulator.deviation_series():
+        print(f"{rolls:>9} rolls: {deviation:.5f}")
+
+    print("----- README table -----")
+    print(markdown_comparison_table(simulator.probabilities()))
+
+    print("----- Early stopping at 0.001 tolerance (95% confidence, p-value >= 0.05) -----")
+    early = IncrementalDiceSimulator(confidence=0.95, seed=README_SEED)
+    early.run(10_000_000, batch_size=50_000, tolerance=0.001, min_p_value=0.05)
+    print(f"Stopped after {early.total_rolls} rolls, "
+          f"max deviation {early.history[-1].max_deviation:.5f}")
+
+    print("----- Three weighted 4-sided dice, 100000 rolls -----")
+    loaded = [1, 1, 1, 3]
+    probs = simulate_dice_rolls(100_000, num_dice=3, faces=4, weights=loaded, seed=README_SEED)
+    print_comparison_table(probs, num_dice=3, faces=4, weights=loaded)